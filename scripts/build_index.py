@@ -1,32 +1,52 @@
 #!/usr/bin/env python3
-import pathlib
+import os, pathlib
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
 # run script with: `python scripts/build_index.py`
 
 ROOT = pathlib.Path("knowledge")
+_NAME = attrgetter("name")
+
+def list_dirs(path):
+    # DirEntry caches the file type from the directory read, so no extra stat() per entry
+    with os.scandir(path) as it:
+        dirs = [e for e in it if e.is_dir(follow_symlinks=False) and not e.name.startswith(".")]
+    dirs.sort(key=_NAME)
+    return dirs
+
+def has_readme(path):
+    with os.scandir(path) as it:
+        return any(e.name == "README.md" and e.is_file() for e in it)
+
+def area_lines(area_dir):
+    lines = [f"## {area_dir.name.upper()}"]
+    for group_dir in list_dirs(area_dir.path):
+        lines.append(f"- {group_dir.name.capitalize()}")
+        for topic_dir in list_dirs(group_dir.path):
+            if has_readme(topic_dir.path):
+                title = topic_dir.name.replace("-", " ").capitalize()
+                rel_path = os.path.relpath(os.path.join(topic_dir.path, "README.md"), ROOT)
+                lines.append(f"  - [{title}]({pathlib.PurePath(rel_path).as_posix()})")
+    lines.append("")  # blank line between areas
+    return lines
 
 def build_index():
-    lines = ["# 📚 Knowledge Index\n"]
-
-    for area_dir in sorted(ROOT.iterdir()):
-        if not area_dir.is_dir() or area_dir.name.startswith("."):
-            continue
-        lines.append(f"## {area_dir.name.upper()}")
-        for group_dir in sorted(area_dir.iterdir()):
-            if not group_dir.is_dir() or group_dir.name.startswith("."):
-                continue
-            lines.append(f"- {group_dir.name.capitalize()}")
-            for topic_dir in sorted(group_dir.iterdir()):
-                if not topic_dir.is_dir() or topic_dir.name.startswith("."):
-                    continue
-                readme = topic_dir / "README.md"
-                if readme.exists():
-                    title = topic_dir.name.replace("-", " ").capitalize()
-                    rel_path = readme.relative_to(ROOT)
-                    lines.append(f"  - [{title}]({rel_path.as_posix()})")
-        lines.append("")  # blank line between areas
-
-    (ROOT / "INDEX.md").write_text("\n".join(lines), encoding="utf-8")
+    # areas are scanned on worker threads (the GIL is released during filesystem calls);
+    # map() yields results in area order so the output stays deterministic. All scans
+    # finish before INDEX.md is opened, so a failed scan leaves the old index intact
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        areas = list(pool.map(area_lines, list_dirs(ROOT)))
+
+    # stream straight into the file; each line is written with its leading separator
+    # so the output matches a "\n".join of the lines without building that string
+    with (ROOT / "INDEX.md").open("w", encoding="utf-8", buffering=1 << 16) as f:
+        f.write("# 📚 Knowledge Index\n")
+        for lines in areas:
+            for line in lines:
+                f.write("\n")
+                f.write(line)
+
     print("✅ knowledge/INDEX.md updated")
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
-import argparse, pathlib, re, sys, textwrap
-from datetime import datetime
+import argparse, os, pathlib, re, sys, textwrap
+from datetime import date
 
 ROOT = pathlib.Path("knowledge")
 
@@ -29,68 +29,92 @@ CATEGORIES = {
     },
 }
 
+README_TEMPLATE = textwrap.dedent("""\
+    # {topic}
+
+    **Area:** {area} / **Group:** {group}  
+    **Created:** {date}
+
+    ## Difficulty
+    (easy|medium|hard)
+
+    ## Why this matters
+    (short note)
+
+    ## Key concepts
+    - …
+
+    ## Pitfalls
+    - …
+
+    ## Further reading
+    - …
+
+    """)
+
+EXAMPLE_EXT = {"python":"py","typescript":"ts","javascript":"js","bash":"sh"}
+EXAMPLE_CODE = {
+    "python": 'print("hello from example")\n',
+    "javascript": 'console.log("hello from example")\n',
+    "typescript": 'console.log("hello from example")\n',
+    "bash": 'echo "hello from example"\n'
+}
+
 def slug(s:str)->str:
     s = s.strip().lower()
     s = re.sub(r"[^a-z0-9]+","-",s).strip("-")
     return re.sub(r"-{2,}","-",s)
 
-def ensure_tree():
+def subdirs(path) -> set:
+    try:
+        with os.scandir(path) as it:
+            return {e.name for e in it if e.is_dir()}
+    except FileNotFoundError:
+        return set()
+
+def ensure_tree(force:bool=False):
+    # skip the per-directory mkdir/touch churn once the tree has been bootstrapped
+    sentinel = ROOT / ".bootstrapped"
+    if sentinel.exists() and not force:
+        return
+    # one scandir per level; only directories that are missing get created
     for area, groups in CATEGORIES.items():
+        existing_groups = subdirs(ROOT / area)
         for group, topics in groups.items():
             base = ROOT / area / group
-            base.mkdir(parents=True, exist_ok=True)
-            (base / ".gitkeep").touch()
-            for t in topics:
+            if group not in existing_groups:
+                base.mkdir(parents=True, exist_ok=True)
+                (base / ".gitkeep").touch()
+            for t in set(topics) - subdirs(base):
                 (base / t).mkdir(parents=True, exist_ok=True)
                 (base / t / ".gitkeep").touch()
     (ROOT / "INDEX.md").touch()
+    sentinel.touch()
 
 def add_topic(area:str, group:str, topic:str, lang:str="python"):
     area = area.lower()
     group = group.lower()
     tslug = slug(topic)
     dest = ROOT / area / group / tslug
-    if not dest.exists():
-        dest.mkdir(parents=True, exist_ok=True)
-    (dest / "examples").mkdir(exist_ok=True)
-    (dest / ".gitkeep").touch()
+    dest_str = os.fspath(dest)
+    # one isdir probe instead of mkdir/mkdir/touch on every re-run; checks examples/
+    # rather than dest so bootstrapped topic dirs (e.g. "react") still get it
+    examples = os.path.join(dest_str, "examples")
+    if not os.path.isdir(examples):
+        os.makedirs(examples, exist_ok=True)
+        open(os.path.join(dest_str, ".gitkeep"), "a").close()
 
     # README
     readme = dest / "README.md"
-    if not readme.exists():
-        readme.write_text(textwrap.dedent(f"""\
-        # {topic}
-
-        **Area:** {area} / **Group:** {group}  
-        **Created:** {datetime.now().strftime("%Y-%m-%d")}
-
-        ## Difficulty
-        (easy|medium|hard)
-
-        ## Why this matters
-        (short note)
-
-        ## Key concepts
-        - …
-
-        ## Pitfalls
-        - …
-
-        ## Further reading
-        - …
-
-        """), encoding="utf-8")
+    if not os.path.lexists(readme):
+        today = date.today().isoformat()
+        readme.write_text(README_TEMPLATE.format(topic=topic, area=area, group=group, date=today), encoding="utf-8")
 
     # Example
-    ext = {"python":"py","typescript":"ts","javascript":"js","bash":"sh"}.get(lang, "txt")
+    ext = EXAMPLE_EXT.get(lang, "txt")
     ex = dest / "examples" / f"main.{ext}"
-    if not ex.exists():
-        code = {
-            "python": 'print("hello from example")\n',
-            "javascript": 'console.log("hello from example")\n',
-            "typescript": 'console.log("hello from example")\n',
-            "bash": 'echo "hello from example"\n'
-        }.get(lang, "Example placeholder.\n")
+    if not os.path.lexists(ex):
+        code = EXAMPLE_CODE.get(lang, "Example placeholder.\n")
         ex.write_text(code, encoding="utf-8")
 
     print(f"✅ Added topic: {dest}")
@@ -113,7 +137,7 @@ def main():
     ROOT = pathlib.Path(args.root) if hasattr(args, "root") else ROOT
 
     if args.cmd == "bootstrap":
-        ensure_tree()
+        ensure_tree(force=True)
         print(f"✅ Bootstrapped under {ROOT}/")
     elif args.cmd == "add":
         ensure_tree()
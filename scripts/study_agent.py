@@ -1,69 +1,116 @@
 #!/usr/bin/env python3
-import re, pathlib, subprocess, sys
-from datetime import datetime
+import json, os, re, pathlib, subprocess, sys
+from datetime import date
+from functools import lru_cache
 
 ROOT = pathlib.Path(__file__).resolve().parent.parent
+CACHE_PATH = ROOT / ".cache" / "journal_parse.json"
+_CACHE_VERSION = 1  # bump whenever the journal parsing logic changes
+
+sys.path.insert(0, str(ROOT / "scripts"))
+import knowledge  # noqa: E402
 
 DATE_H = r"^##\s*(\d{4}-\d{2}-\d{2})\s*$"
 BLOCK = r"(?:(?!^##\s*\d{4}-\d{2}-\d{2}\s*$).)*"  # up to next date heading
 
-def parse_yearly_journal(md_path: pathlib.Path, target_date: str | None):
-    text = md_path.read_text(encoding="utf-8")
+# compiled once at import instead of on every parse
+_DATE_RE = re.compile(DATE_H)
 
+@lru_cache(maxsize=8)
+def _heading_re(heading: str):
+    return re.compile(rf"^{heading}:\s*\n({BLOCK})", re.IGNORECASE | re.MULTILINE)
+
+def load_cache() -> dict:
+    try:
+        return json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def parse_yearly_journal(md_path: pathlib.Path, target_date: str | None):
     # If no date passed, default to today
     if not target_date:
-        target_date = datetime.now().strftime("%Y-%m-%d")
-
-    # Grab the section for that date
-    sec_re = re.compile(
-        rf"{DATE_H}\n({BLOCK})",
-        re.MULTILINE | re.DOTALL
-    )
-    section = None
-    for m in sec_re.finditer(text):
-        date = m.group(1)
-        body = m.group(2)
-        if date == target_date:
-            section = body
-            break
+        target_date = date.today().isoformat()
+
+    # Re-runs against an unchanged journal reuse the cached parse (keyed on parser
+    # version + path + mtime)
+    version_key = f"v{_CACHE_VERSION}:"
+    path_key = f"{version_key}{md_path.resolve()}:"
+    mtime_key = f"{path_key}{os.stat(md_path).st_mtime_ns}:"
+    key = f"{mtime_key}{target_date}"
+    cache = load_cache()
+    if key in cache:
+        return cache[key]
+
+    data = _parse_journal(md_path, target_date)
+
+    # drop entries from older parser versions and older versions of this journal
+    # so the cache doesn't grow forever
+    cache = {
+        k: v for k, v in cache.items()
+        if k.startswith(version_key) and (not k.startswith(path_key) or k.startswith(mtime_key))
+    }
+    cache[key] = data
+    try:
+        CACHE_PATH.parent.mkdir(exist_ok=True)
+        CACHE_PATH.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+    except OSError:
+        pass  # caching is best-effort
+    return data
+
+def _parse_journal(md_path: pathlib.Path, target_date: str):
+    # Grab the section for that date: stream the file line by line and stop reading
+    # at the next date heading instead of loading the whole journal
+    body = None
+    with md_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            m = _DATE_RE.match(line)
+            if body is None:
+                if m and m.group(1) == target_date:
+                    body = []
+            elif m:
+                break
+            else:
+                body.append(line)
+    section = "\n".join(body) + "\n" if body else None
 
     if not section:
         return {"date": target_date, "topics": [], "notes": []}
 
     def parse_list(heading: str):
-        rx = re.compile(rf"^{heading}:\s*\n({BLOCK})", re.IGNORECASE | re.MULTILINE)
-        mm = rx.search(section)
+        mm = _heading_re(heading).search(section)
         if not mm:
             return []
-        bullets = re.findall(r"^\s*-\s*(.+?)\s*$", mm.group(1), re.MULTILINE)
-        return [b.strip() for b in bullets if b.strip()]
+        bullets = []
+        for line in mm.group(1).splitlines():
+            line = line.lstrip()
+            if line.startswith("-"):
+                b = line[1:].strip()
+                if b:
+                    bullets.append(b)
+        return bullets
 
     topics = parse_list("Topics")
     notes  = parse_list("Notes")
     return {"date": target_date, "topics": topics, "notes": notes}
 
-def add_topic(area, group, topic, lang="python"):
-    subprocess.run(
-        ["python", "scripts/knowledge.py", "add", area, group, topic, "--lang", lang],
-        check=True
-    )
+# checked in order; first group with a keyword anywhere in the topic wins
+ROUTES = [
+    (["react", "ag grid", "frontend", "tsx", "typescript"], ("swe", "frontend", "typescript")),
+    (["git", "docker", "kubernetes", "ci/cd", "ci-cd", "shell", "zsh", "brew", "homebrew"], ("swe", "devops", "bash")),
+    (["java", "spring"], ("swe", "backend", "java")),
+    (["django", "python"], ("swe", "backend", "python")),
+    (["langchain", "agent", "crewai"], ("ai", "agents", "python")),
+    (["rag", "prompt", "fine-tuning", "evals", "transformer", "embedding"], ("ai", "llms", "python")),
+    (["sklearn", "regression", "clustering", "pytorch", "tensorflow"], ("ml", "frameworks", "python")),
+]
 
 def route(topic: str):
     t = topic.lower()
-    if any(k in t for k in ["react", "ag grid", "frontend", "tsx", "typescript"]):
-        return ("swe", "frontend", "typescript")
-    if any(k in t for k in ["git", "docker", "kubernetes", "ci/cd", "ci-cd", "shell", "zsh", "brew", "homebrew"]):
-        return ("swe", "devops", "bash")
-    if any(k in t for k in ["java", "spring"]):
-        return ("swe", "backend", "java")
-    if any(k in t for k in ["django", "python"]):
-        return ("swe", "backend", "python")
-    if any(k in t for k in ["langchain", "agent", "crewai"]):
-        return ("ai", "agents", "python")
-    if any(k in t for k in ["rag", "prompt", "fine-tuning", "evals", "transformer", "embedding"]):
-        return ("ai", "llms", "python")
-    if any(k in t for k in ["sklearn", "regression", "clustering", "pytorch", "tensorflow"]):
-        return ("ml", "frameworks", "python")
+    for keys, dest in ROUTES:
+        for k in keys:
+            if k in t:
+                return dest
     return ("swe", "misc", "python")
 
 def main():
@@ -81,11 +128,15 @@ def main():
         print(f"No topics found for {data['date']}. Add a 'Topics:' list under '## {data['date']}'.")
         sys.exit(0)
 
+    # add topics in-process rather than spawning `knowledge.py add` per topic
+    knowledge.ensure_tree()
     for t in data["topics"]:
         area, group, lang = route(t)
-        add_topic(area, group, t, lang)
+        knowledge.add_topic(area, group, t, lang=lang)
 
     # Optional: commit
+    # a run normally creates new topic dirs, so `add -A` + `commit` (2 git processes)
+    # is already the minimum; probing `git status` first would only add a third
     try:
         subprocess.run(["git", "add", "-A"], cwd=ROOT, check=True)
         subprocess.run(["git", "commit", "-m", f"study: {data['date']} topics"], cwd=ROOT, check=True)